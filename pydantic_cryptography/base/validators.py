@@ -1,10 +1,23 @@
 """Common Pydantic validators."""
 
+import functools
 from typing import Any
 
 from cryptography import x509
 
 
+@functools.lru_cache(maxsize=256)
+def get_object_identifier(value: str) -> x509.ObjectIdentifier:
+    """Get a (cached) :py:class:`~cryptography.x509.ObjectIdentifier` for the given dotted string.
+
+    The set of OIDs seen in practice is very small, so instances are cached to avoid parsing the
+    same dotted string over and over again.
+
+    :raises ValueError: If `value` is not a valid dotted string.
+    """
+    return x509.ObjectIdentifier(value)
+
+
 def oid_to_dotted_string_validator(value: Any) -> Any:
     """Validate a :py:class:`~cryptography.x509.ObjectIdentifier`."""
     if isinstance(value, x509.ObjectIdentifier):
@@ -15,7 +28,7 @@ def oid_to_dotted_string_validator(value: Any) -> Any:
 def dotted_string_after_validator(value: str) -> str:
     """Validate that the given value is a valid, dotted string."""
     try:
-        x509.ObjectIdentifier(value)
+        get_object_identifier(value)
     except ValueError as ex:
         raise ValueError(f"{value}: Invalid object identifier") from ex
     return value
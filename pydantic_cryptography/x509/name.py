@@ -1,17 +1,18 @@
 """Model for x509.Name."""
 
-import base64
+import binascii
 from collections.abc import Iterator
 from typing import Any, cast, overload
 
 from cryptography import x509
 from cryptography.x509.name import _ASN1Type
 from cryptography.x509.oid import NameOID
-from pydantic import ConfigDict, Field, model_validator
+from pydantic import ConfigDict, Field, field_validator, model_validator
 from pydantic_core.core_schema import ValidationInfo
 
 from pydantic_cryptography.base.models import CryptographyModel, CryptographyRootModel
 from pydantic_cryptography.base.types import ObjectIdentifierType
+from pydantic_cryptography.base.validators import get_object_identifier
 
 _NAME_ATTRIBUTE_OID_DESCRIPTION = "A dotted string representing the OID."
 _NAME_ATTRIBUTE_VALUE_DESCRIPTION = (
@@ -26,7 +27,14 @@ _NAME_ATTRIBUTE_VALUE_DESCRIPTION = (
 # WARNING: sync any updates here to model_settings.SettingsModel._check_name().
 #: OIDs that can occur multiple times in a certificate
 MULTIPLE_OIDS = (NameOID.DOMAIN_COMPONENT, NameOID.ORGANIZATIONAL_UNIT_NAME, NameOID.STREET_ADDRESS)
-MULTIPLE_OID_STRINGS = tuple(oid.dotted_string for oid in MULTIPLE_OIDS)
+MULTIPLE_OID_STRINGS: frozenset[str] = frozenset(oid.dotted_string for oid in MULTIPLE_OIDS)
+
+# OIDs that are subject to additional validation in NameAttributeModel
+_COUNTRY_CODE_OID_STRINGS = frozenset(
+    (NameOID.COUNTRY_NAME.dotted_string, NameOID.JURISDICTION_COUNTRY_NAME.dotted_string)
+)
+_COMMON_NAME_OID_STRING = NameOID.COMMON_NAME.dotted_string
+_X500_UNIQUE_IDENTIFIER_OID_STRING = NameOID.X500_UNIQUE_IDENTIFIER.dotted_string
 
 
 class NameAttributeModel(CryptographyModel["x509.NameAttribute[str | bytes]"]):
@@ -78,32 +86,31 @@ class NameAttributeModel(CryptographyModel["x509.NameAttribute[str | bytes]"]):
         """Validator to handle x500 unique identifiers."""
         if isinstance(data, x509.NameAttribute) and data.oid == NameOID.X500_UNIQUE_IDENTIFIER:
             value = cast(bytes, data.value)
-            return {"oid": data.oid.dotted_string, "value": base64.b64encode(value).decode("ascii")}
+            return {
+                "oid": data.oid.dotted_string,
+                "value": binascii.b2a_base64(value, newline=False).decode("ascii"),
+            }
         return data
 
-    @model_validator(mode="after")
-    def validate_name_attribute(self) -> "NameAttributeModel":
-        """Validate that country code OIDs have exactly two characters."""
-        country_code_oids = (
-            NameOID.COUNTRY_NAME.dotted_string,
-            NameOID.JURISDICTION_COUNTRY_NAME.dotted_string,
-        )
-        if self.oid in country_code_oids and len(self.value) != 2:
-            raise ValueError(f"{self.value}: Must have exactly two characters")
-
-        cn_oid = NameOID.COMMON_NAME.dotted_string
-        if self.oid == cn_oid and not 1 <= len(self.value) <= 64:
+    @field_validator("value")
+    @classmethod
+    def validate_value(cls, value: str, info: ValidationInfo) -> str:
+        """Validate the value for OIDs with additional constraints (e.g. country codes)."""
+        oid = info.data.get("oid")  # not present if the OID failed to validate
+        if oid in _COUNTRY_CODE_OID_STRINGS and len(value) != 2:
+            raise ValueError(f"{value}: Must have exactly two characters")
+        elif oid == _COMMON_NAME_OID_STRING and not 1 <= len(value) <= 64:
             raise ValueError(
-                f"{cn_oid} length must be >= 1 and <= 64, but it was {len(self.value)}"
+                f"{_COMMON_NAME_OID_STRING} length must be >= 1 and <= 64, but it was {len(value)}"
             )
-        return self
+        return value
 
     @property
     def cryptography(self) -> "x509.NameAttribute[str | bytes]":
         """The :py:class:`~cg:cryptography.x509.NameAttribute` instance for this model."""
-        oid = x509.ObjectIdentifier(self.oid)
-        if oid == NameOID.X500_UNIQUE_IDENTIFIER:
-            value = base64.b64decode(self.value)
+        oid = get_object_identifier(self.oid)
+        if self.oid == _X500_UNIQUE_IDENTIFIER_OID_STRING:
+            value = binascii.a2b_base64(self.value)
             return x509.NameAttribute(oid=oid, value=value, _type=_ASN1Type.BitString)
 
         return x509.NameAttribute(oid=oid, value=self.value)
@@ -34,15 +34,21 @@ def assert_cryptography_model(
 
 def assert_validation_errors(
     model_class: type[BaseModel],
-    parameters: list[dict[str, Any]] | dict[str, Any],
+    parameters: list[dict[str, Any]] | dict[str, Any] | object,
     expected_errors: ExpectedErrors,
 ) -> None:
-    """Assertion method to test validation errors."""
+    """Assertion method to test validation errors.
+
+    Lists and dicts are passed to the model constructor, any other value is passed to
+    ``model_validate()``.
+    """
     with pytest.raises(ValidationError) as ex_info:  # noqa: PT012
         if isinstance(parameters, list):
             model_class(parameters)  # type: ignore[call-arg]  # ruled out with overload
-        else:
+        elif isinstance(parameters, dict):
             model_class(**parameters)
+        else:
+            model_class.model_validate(parameters)
 
     errors = ex_info.value.errors()
     assert len(expected_errors) == len(errors)
@@ -42,6 +42,22 @@ def test_name_attribute(
     assert_cryptography_model(NameAttributeModel, parameters, name_attr)
 
 
+def test_name_attribute_subclass() -> None:
+    """Test that subclasses of NameAttribute are parsed like NameAttribute itself."""
+
+    class CustomNameAttribute(x509.NameAttribute):
+        pass
+
+    name_attr = CustomNameAttribute(
+        oid=NameOID.X500_UNIQUE_IDENTIFIER, value=b"example.com", _type=_ASN1Type.BitString
+    )
+    model = NameAttributeModel.model_validate(name_attr)
+    assert model == NameAttributeModel(
+        oid=NameOID.X500_UNIQUE_IDENTIFIER.dotted_string, value="ZXhhbXBsZS5jb20="
+    )
+    assert model.cryptography == name_attr
+
+
 @pytest.mark.parametrize(
     ("parameters", "errors"),
     (
@@ -69,7 +85,7 @@ def test_name_attribute_errors(parameters: dict[str, str], errors: ExpectedError
 def test_name_attribute_country_code_errors(oid: str, value: str) -> None:
     """Test validation for country codes."""
     errors: ExpectedErrors = [
-        ("value_error", (), f"Value error, {value}: Must have exactly two characters")
+        ("value_error", ("value",), f"Value error, {value}: Must have exactly two characters")
     ]
     assert_validation_errors(NameAttributeModel, {"oid": oid, "value": value}, errors)
 
@@ -80,7 +96,7 @@ def test_name_attribute_empty_common_name(oid: Any) -> None:
     errors: ExpectedErrors = [
         (
             "value_error",
-            (),
+            ("value",),
             f"Value error, {NameOID.COMMON_NAME.dotted_string} length must be >= 1 "
             f"and <= 64, but it was 0",
         )
@@ -109,6 +125,18 @@ def test_name_attribute_empty_common_name(oid: Any) -> None:
                 x509.NameAttribute(oid=NameOID.COMMON_NAME, value="example.com"),
             ],
         ),
+        (
+            [
+                {"oid": NameOID.ORGANIZATIONAL_UNIT_NAME.dotted_string, "value": "OrgUnit1"},
+                {"oid": NameOID.ORGANIZATIONAL_UNIT_NAME.dotted_string, "value": "OrgUnit2"},
+                {"oid": NameOID.COMMON_NAME.dotted_string, "value": "example.com"},
+            ],
+            [
+                x509.NameAttribute(oid=NameOID.ORGANIZATIONAL_UNIT_NAME, value="OrgUnit1"),
+                x509.NameAttribute(oid=NameOID.ORGANIZATIONAL_UNIT_NAME, value="OrgUnit2"),
+                x509.NameAttribute(oid=NameOID.COMMON_NAME, value="example.com"),
+            ],
+        ),
     ),
 )
 def test_name(
@@ -118,6 +146,17 @@ def test_name(
     assert_cryptography_model(NameModel, {"root": serialized}, x509.Name(expected))  # type: ignore[type-var]
 
 
+def test_name_with_str_subclass() -> None:
+    """Test that NameModel accepts subclasses of str."""
+
+    class CustomStr(str):
+        __slots__ = ()
+
+    assert NameModel.model_validate(CustomStr("CN=example.com")) == NameModel.model_validate(
+        "CN=example.com"
+    )
+
+
 def test_iterable() -> None:
     """Test that NameModel is iterable."""
     name = NameModel.model_validate("CN=example.com,OU=ExampleOrgUnit,O=ExampleOrg,ST=Vienna,C=AT")
@@ -156,8 +195,59 @@ def test_iterable() -> None:
                 )
             ],
         ),
+        (
+            [
+                {"oid": NameOID.COMMON_NAME.dotted_string, "value": "example.com"},
+                {"oid": NameOID.ORGANIZATION_NAME.dotted_string, "value": "OrgName1"},
+                {"oid": NameOID.ORGANIZATION_NAME.dotted_string, "value": "OrgName2"},
+                {"oid": NameOID.COMMON_NAME.dotted_string, "value": "example.net"},
+            ],
+            [
+                (
+                    "value_error",
+                    (),
+                    (
+                        f"Value error, Name attribute of type "
+                        f"{NameOID.ORGANIZATION_NAME.dotted_string} must not occur more then once."
+                    ),
+                )
+            ],
+        ),
     ),
 )
 def test_name_errors(value: list[dict[str, Any]], errors: ExpectedErrors) -> None:
     """Test validation errors for NameModel."""
     assert_validation_errors(NameModel, value, errors)
+
+
+@pytest.mark.parametrize(
+    ("oid", "value", "errors"),
+    (
+        (
+            NameOID.COMMON_NAME,
+            "",
+            [
+                (
+                    "value_error",
+                    ("value",),
+                    (
+                        f"Value error, {NameOID.COMMON_NAME.dotted_string} length must be >= 1 "
+                        f"and <= 64, but it was 0"
+                    ),
+                )
+            ],
+        ),
+        (
+            NameOID.COUNTRY_NAME,
+            "ABC",
+            [("value_error", ("value",), "Value error, ABC: Must have exactly two characters")],
+        ),
+    ),
+)
+def test_name_attribute_errors_with_name_attribute(
+    oid: x509.ObjectIdentifier, value: str, errors: ExpectedErrors
+) -> None:
+    """Test that errors for NameAttribute input have the same location as for dict input."""
+    with pytest.warns(UserWarning, match=r"^Attribute's length must be >= "):
+        name_attr = x509.NameAttribute(oid=oid, value=value, _validate=False)
+    assert_validation_errors(NameAttributeModel, name_attr, errors)